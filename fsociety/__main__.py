@@ -5,6 +5,7 @@ import sys
 from random import choice
 
 from rich.columns import Columns
+from rich.console import Group
 from rich.text import Text
 
 import fsociety.core.utilities
@@ -96,11 +97,11 @@ def print_menu_items():
         tools_str.append(tools)
         cols.append(tools_str)
 
-    console.print(Columns(cols, equal=True, expand=True))
-
+    builtin_rows = []
     for key in BUILTIN_FUNCTIONS:
-        print()
-        console.print(key, style="command")
+        builtin_rows.extend((Text(), Text(key, style="command")))
+
+    console.print(Group(Columns(cols, equal=True, expand=True), *builtin_rows))
 
 
 def agreement():
@@ -12,6 +12,15 @@ from fsociety.core.validation import validate_command_arg
 
 logger = get_logger(__name__)
 
+# Menu choice -> ScoutSuite provider name
+SCOUTSUITE_PROVIDERS = {
+    "1": "aws",
+    "2": "azure",
+    "3": "gcp",
+    "4": "aliyun",
+    "5": "oci",
+}
+
 
 class ScoutSuiteRepo(GitHubRepo):
     """Multi-cloud security auditing tool (AWS, Azure, GCP, etc.)."""
@@ -37,15 +46,7 @@ class ScoutSuiteRepo(GitHubRepo):
 
         provider_choice = input("\nSelect cloud provider [1-5]: ").strip()
 
-        provider_map = {
-            "1": "aws",
-            "2": "azure",
-            "3": "gcp",
-            "4": "aliyun",
-            "5": "oci",
-        }
-
-        provider = provider_map.get(provider_choice)
+        provider = SCOUTSUITE_PROVIDERS.get(provider_choice)
         if not provider:
             logger.error(f"Invalid provider choice: {provider_choice}")
             return 1
@@ -11,7 +11,9 @@ import functools
 import hashlib
 import json
 import logging
+import os
 import pickle
+import tempfile
 import time
 from pathlib import Path
 from typing import Any, Callable, ParamSpec, TypeVar
@@ -24,6 +26,9 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Seconds after which an orphaned temporary file is swept
+STALE_TMP_AGE = 300
+
 
 class Cache:
     """Simple disk-based cache with TTL support."""
@@ -51,8 +56,9 @@ class Cache:
 
     def _get_cache_path(self, key: str) -> Path:
         """Get path for cache key."""
-        # Hash the key to create valid filename
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        # Hash the key to create valid filename; this only needs to be
+        # collision resistant, so use the faster 128-bit BLAKE2b
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{key_hash}.cache"
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -68,21 +74,20 @@ class Cache:
         """
         cache_path = self._get_cache_path(key)
 
-        if not cache_path.exists():
-            return default
-
         try:
             with open(cache_path, "rb") as f:
                 data = pickle.load(f)
 
             # Check if expired
             if data["expires_at"] < time.time():
-                cache_path.unlink()
+                cache_path.unlink(missing_ok=True)
                 return default
 
             logger.debug(f"Cache hit: {key}")
             return data["value"]
 
+        except FileNotFoundError:
+            return default
         except Exception as e:
             logger.warning(f"Cache read failed: {e}")
             return default
@@ -103,55 +108,76 @@ class Cache:
         if ttl is None:
             ttl = self.default_ttl
 
+        expires_at = time.time() + ttl
         data = {
             "value": value,
-            "expires_at": time.time() + ttl,
+            "expires_at": expires_at,
         }
 
+        # Write to a uniquely named temporary file and swap it in so
+        # readers never see a partially written entry, even when several
+        # processes cache the same key at once
+        tmp_path = None
+
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data, f)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with open(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Stamp the expiry time as mtime so sweeps only need a stat
+            os.utime(tmp_path, (expires_at, expires_at))
+            os.replace(tmp_path, cache_path)
 
             logger.debug(f"Cache set: {key} (TTL={ttl}s)")
 
         except Exception as e:
             logger.warning(f"Cache write failed: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
 
     def delete(self, key: str) -> None:
         """Delete key from cache."""
         cache_path = self._get_cache_path(key)
-        if cache_path.exists():
+        try:
             cache_path.unlink()
             logger.debug(f"Cache deleted: {key}")
+        except FileNotFoundError:
+            pass
 
     def clear(self) -> None:
-        """Clear all cache entries."""
-        for cache_file in self.cache_dir.glob("*.cache"):
-            cache_file.unlink()
+        """Clear all cache entries, including leftover temporary files."""
+        for pattern in ("*.cache", "*.tmp"):
+            for cache_file in self.cache_dir.glob(pattern):
+                cache_file.unlink(missing_ok=True)
         logger.info("Cache cleared")
 
     def cleanup_expired(self) -> int:
         """
-        Remove expired cache entries.
+        Remove expired cache entries and stale temporary files.
 
         Returns:
-            Number of entries removed
+            Number of files removed
         """
         removed = 0
-        for cache_file in self.cache_dir.glob("*.cache"):
-            try:
-                with open(cache_file, "rb") as f:
-                    data = pickle.load(f)
-
-                if data["expires_at"] < time.time():
-                    cache_file.unlink()
-                    removed += 1
-
-            except Exception as e:
-                logger.debug(f"Error checking {cache_file}: {e}")
-                # Remove corrupted cache files
-                cache_file.unlink()
-                removed += 1
+        now = time.time()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".cache"):
+                    # Entries carry their expiry time as mtime (see set())
+                    cutoff = now
+                elif entry.name.endswith(".tmp"):
+                    # Leftovers from a failed or interrupted write; give
+                    # writes still in flight time to finish
+                    cutoff = now - STALE_TMP_AGE
+                else:
+                    continue
+
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+
+                except OSError as e:
+                    logger.debug(f"Error checking {entry.path}: {e}")
 
         if removed:
             logger.info(f"Removed {removed} expired cache entries")
@@ -159,8 +185,20 @@ class Cache:
         return removed
 
 
-# Global cache instance
-_cache = Cache()
+@functools.cache
+def get_cache() -> Cache:
+    """
+    Get the shared cache instance, creating it on first use.
+
+    The cache is swept once per process so entries that are never read
+    again do not linger until the next lookup.
+
+    Returns:
+        Global Cache instance
+    """
+    cache = Cache()
+    cache.cleanup_expired()
+    return cache
 
 
 def cached(
@@ -197,19 +235,19 @@ def cached(
             cache_key = ":".join(key_parts)
 
             # Try to get from cache
-            result = _cache.get(cache_key)
+            result = get_cache().get(cache_key)
             if result is not None:
                 return result
 
             # Execute function and cache result
             result = func(*args, **kwargs)
-            _cache.set(cache_key, result, ttl=ttl)
+            get_cache().set(cache_key, result, ttl=ttl)
 
             return result
 
         # Add cache control methods
-        wrapper.cache_clear = lambda: _cache.clear()  # type: ignore
-        wrapper.cache_info = lambda: {"cache_dir": str(_cache.cache_dir)}  # type: ignore
+        wrapper.cache_clear = lambda: get_cache().clear()  # type: ignore
+        wrapper.cache_info = lambda: {"cache_dir": str(get_cache().cache_dir)}  # type: ignore
 
         return wrapper
 
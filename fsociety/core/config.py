@@ -1,5 +1,6 @@
 import os.path
 from configparser import NoOptionError, RawConfigParser
+from functools import cache
 from pathlib import Path
 from sys import platform
 
@@ -29,6 +30,8 @@ DEFAULT_CONFIG = {
 }
 
 
+# Every module shares one parser, so the file is read and checked once
+@cache
 def get_config() -> RawConfigParser:
     config = RawConfigParser()
     if not os.path.exists(INSTALL_DIR):
@@ -7,13 +7,12 @@ timeout support, and shell injection prevention.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import shlex
 import subprocess
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from fsociety.core.validation import sanitize_shell_arg
 
@@ -203,11 +202,14 @@ async def execute_command_async(
         >>> result = await execute_command_async(["ls", "-la"])
         >>> print(result.stdout)
     """
+    import asyncio
+
     if isinstance(command, str):
         command = shlex.split(command)
 
     logger.debug(f"Executing async command: {command}")
 
+    process = None
     try:
         process = await asyncio.create_subprocess_exec(
             *command,
@@ -249,6 +251,12 @@ async def execute_command_async(
         raise TimeoutError(
             f"Command timed out after {timeout} seconds"
         ) from e
+    except asyncio.CancelledError:
+        # Don't leave the child running when the awaiting task is cancelled
+        if process and process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
     except Exception as e:
         logger.error(f"Async command execution failed: {e}")
         raise ExecutionError(f"Command execution failed: {e}") from e
@@ -324,6 +332,12 @@ async def execute_concurrent(
     Returns:
         List of ExecutionResults in order
 
+    Raises:
+        ValueError: If max_concurrent is less than 1
+        ExecutionError: If a command fails; commands still running are
+            cancelled and the remaining ones are not started
+        TimeoutError: If a command times out, with the same cancellation
+
     Example:
         >>> commands = [
         ...     (["ls", "-la"], {}),
@@ -331,15 +345,32 @@ async def execute_concurrent(
         ... ]
         >>> results = await execute_concurrent(commands)
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def execute_with_semaphore(
-        command: list[str], kwargs: dict[str, Any]
-    ) -> ExecutionResult:
-        async with semaphore:
-            return await execute_command_async(command, **kwargs)
-
-    tasks = [
-        execute_with_semaphore(cmd, kwargs) for cmd, kwargs in commands
-    ]
-    return await asyncio.gather(*tasks, return_exceptions=False)
+    import asyncio
+
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+    results: list[ExecutionResult | None] = [None] * len(commands)
+    pending = iter(enumerate(commands))
+
+    # A fixed pool of workers pulls from a shared iterator, so only
+    # max_concurrent coroutines exist at once instead of one per command
+    async def worker() -> None:
+        for index, (command, kwargs) in pending:
+            results[index] = await execute_command_async(command, **kwargs)
+
+    # TaskGroup cancels the remaining workers as soon as one fails;
+    # re-raise that failure itself rather than the wrapping group, and
+    # do it outside the handler so the group is not chained as context
+    failure: BaseException | None = None
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(max_concurrent, len(commands))):
+                tg.create_task(worker())
+    except ExceptionGroup as eg:
+        failure = eg.exceptions[0]
+    if failure is not None:
+        raise failure
+
+    # Every slot is filled once the workers finish without error
+    return cast(list[ExecutionResult], results)
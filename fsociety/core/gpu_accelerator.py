@@ -7,6 +7,7 @@ using hashcat and CUDA/OpenCL when available.
 
 from __future__ import annotations
 
+import functools
 import logging
 import shutil
 from dataclasses import dataclass
@@ -44,7 +45,7 @@ class AttackMode(Enum):
     HYBRID_MASK_WORDLIST = 7  # Hybrid mask + wordlist
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GPUInfo:
     """Information about available GPU resources."""
 
@@ -52,7 +53,7 @@ class GPUInfo:
     has_opencl: bool
     has_hashcat: bool
     gpu_count: int
-    gpu_devices: list[str]
+    gpu_devices: tuple[str, ...]
     recommended_backend: Literal["cuda", "opencl", "cpu"] | None
 
     def is_available(self) -> bool:
@@ -60,10 +61,14 @@ class GPUInfo:
         return (self.has_cuda or self.has_opencl) and self.has_hashcat
 
 
+@functools.cache
 def detect_gpu() -> GPUInfo:
     """
     Detect available GPU resources and capabilities.
 
+    Probing spawns nvidia-smi and hashcat, so the result is cached for
+    the lifetime of the process.
+
     Returns:
         GPUInfo with detected capabilities
 
@@ -76,7 +81,7 @@ def detect_gpu() -> GPUInfo:
     has_opencl = False
     has_hashcat = shutil.which("hashcat") is not None
     gpu_count = 0
-    gpu_devices = []
+    gpu_devices: tuple[str, ...] = ()
     recommended_backend = None
 
     # Check for CUDA
@@ -90,11 +95,11 @@ def detect_gpu() -> GPUInfo:
             )
             if result.success:
                 has_cuda = True
-                gpu_devices = [
+                gpu_devices = tuple(
                     line.strip()
                     for line in result.stdout.strip().split("\n")
                     if line.strip()
-                ]
+                )
                 gpu_count = len(gpu_devices)
                 recommended_backend = "cuda"
                 logger.info(f"Detected {gpu_count} CUDA GPU(s): {gpu_devices}")
@@ -207,17 +212,16 @@ class HashcatCracker:
                         "BRUTE_FORCE attack requires a mask"
                     )
 
-        # Build hashcat command
-        command = ["hashcat"]
-
-        # Attack mode
-        command.extend(["-a", str(attack_mode.value)])
-
-        # Hash type
-        command.extend(["-m", str(hash_type.value)])
-
-        # Workload profile
-        command.extend(["-w", str(workload_profile)])
+        # Build hashcat command: attack mode, hash type, workload profile
+        command = [
+            "hashcat",
+            "-a",
+            str(attack_mode.value),
+            "-m",
+            str(hash_type.value),
+            "-w",
+            str(workload_profile),
+        ]
 
         # GPU/CPU selection
         if not use_gpu or not self.gpu_info.is_available():
@@ -3,6 +3,7 @@ import shutil
 from typing import Iterable
 
 from rich import box
+from rich.console import Group
 from rich.style import Style
 from rich.table import Table
 from rich.text import Text
@@ -95,8 +96,7 @@ def tools_cli(name, tools, links=True):
             args.append(text_link)
         table.add_row(*args)
 
-    console.print(table)
-    console.print("back", style="command")
+    console.print(Group(table, Text("back", style="command")))
     set_readline(list(tools_dict.keys()) + BACK_COMMANDS)
     selected_tool = input(prompt(name.split(".")[-2])).strip()
     if selected_tool not in tools_dict:
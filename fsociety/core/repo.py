@@ -10,14 +10,12 @@ from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from shutil import rmtree, which
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from git import RemoteProgress, Repo
-from rich.progress import BarColumn, Progress, TaskID
 from rich.table import Table
 
 from fsociety.console import console
-from fsociety.core.cache import cached
 from fsociety.core.config import INSTALL_DIR, get_config
 from fsociety.core.executor import (
     ExecutionError,
@@ -28,6 +26,9 @@ from fsociety.core.executor import (
 from fsociety.core.logging_config import get_logger
 from fsociety.core.menu import confirm
 
+if TYPE_CHECKING:
+    from rich.progress import TaskID
+
 logger = get_logger(__name__)
 config = get_config()
 
@@ -47,7 +48,21 @@ class CloneError(Exception):
 class GitProgress(RemoteProgress):
     """Progress reporter for git operations."""
 
+    OPCODE_STRS = {
+        RemoteProgress.COUNTING: "Counting",
+        RemoteProgress.COMPRESSING: "Compressing",
+        RemoteProgress.WRITING: "Writing",
+        RemoteProgress.RECEIVING: "Receiving",
+        RemoteProgress.RESOLVING: "Resolving",
+        RemoteProgress.FINDING_SOURCES: "Finding sources",
+        RemoteProgress.CHECKING_OUT: "Checking out",
+    }
+
     def __init__(self) -> None:
+        # rich.progress is only needed while cloning, so keep it off the
+        # import path of every tool module
+        from rich.progress import BarColumn, Progress
+
         super().__init__()
         self.progress = Progress(
             "[progress.description]{task.description}",
@@ -66,15 +81,6 @@ class GitProgress(RemoteProgress):
         msg: str | None = None,
     ) -> None:
         """Update progress bar based on git operation."""
-        opcode_strs = {
-            self.COUNTING: "Counting",
-            self.COMPRESSING: "Compressing",
-            self.WRITING: "Writing",
-            self.RECEIVING: "Receiving",
-            self.RESOLVING: "Resolving",
-            self.FINDING_SOURCES: "Finding sources",
-            self.CHECKING_OUT: "Checking out",
-        }
         stage, real_opcode = opcode & self.STAGE_MASK, opcode & self.OP_MASK
 
         try:
@@ -90,7 +96,7 @@ class GitProgress(RemoteProgress):
                 )
             self.current_opcode = real_opcode
             self.task = self.progress.add_task(
-                opcode_strs[real_opcode].ljust(15), msg=""
+                self.OPCODE_STRS[real_opcode].ljust(15), msg=""
             )
 
         if stage & self.BEGIN:
@@ -173,7 +179,6 @@ class GitHubRepo(metaclass=ABCMeta):
         """Return normalized tool name."""
         return self.name.lower().replace("-", "_")
 
-    @cached(ttl=300)
     def _get_clone_url(self) -> str:
         """Get clone URL based on configuration."""
         if config.getboolean("fsociety", "ssh_clone"):
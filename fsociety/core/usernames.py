@@ -1,5 +1,5 @@
 import os.path
-from typing import List
+from typing import Iterable, List
 
 from fsociety.core.config import INSTALL_DIR, get_config
 
@@ -11,11 +11,21 @@ full_path = os.path.join(INSTALL_DIR, config.get("fsociety", "usernames_file"))
 def get_usernames() -> List[str]:
     try:
         with open(full_path, encoding="utf-8") as usernamefile:
-            return [username.strip() for username in usernamefile]
+            # Skip blank lines and drop duplicates in a single pass, keeping
+            # file order for readline completion
+            usernames = (username.strip() for username in usernamefile)
+            return list(dict.fromkeys(username for username in usernames if username))
     except FileNotFoundError:
         return []
 
 
 def add_username(username: str) -> None:
+    add_usernames((username,))
+
+
+def add_usernames(usernames: Iterable[str]) -> None:
+    new_usernames = "".join(f"\n{username}" for username in usernames)
+    if not new_usernames:
+        return
     with open(full_path, "a", encoding="utf-8") as usernamefile:
-        usernamefile.write(f"\n{username}")
+        usernamefile.write(new_usernames)
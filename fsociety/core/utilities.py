@@ -1,11 +1,10 @@
 import os
 from abc import ABCMeta
 from base64 import b64decode
+from operator import itemgetter
 from socket import gethostbyname
 from webbrowser import open_new_tab
 
-from requests import get
-
 from fsociety.console import console
 
 from .config import GITHUB_PATH, INSTALL_DIR
@@ -74,6 +73,9 @@ class print_contributors(Utility):
         super().__init__(description="Prints the usernames of our devs")
 
     def run(self):
+        # requests is slow to import and only needed here
+        from requests import get
+
         console.print(
             """
     8888b.  888888 Yb    dP .dP"Y8
@@ -89,7 +91,7 @@ class print_contributors(Utility):
         )
         contributors = response.json()
         for contributor in sorted(
-            contributors, key=lambda c: c["contributions"], reverse=True
+            contributors, key=itemgetter("contributions"), reverse=True
         ):
             username = contributor.get("login")
             console.print(f" {username} ".center(30, "-"))
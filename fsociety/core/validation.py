@@ -20,6 +20,14 @@ from pydantic import BaseModel, Field, field_validator
 
 T = TypeVar("T")
 
+# Patterns and character sets used by the validators, built once at import
+SCHEME_PATTERN = re.compile(r"^https?://")
+DOMAIN_PATTERN = re.compile(
+    r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+"
+    r"[a-zA-Z]{2,}$"
+)
+DANGEROUS_CHARS = frozenset(";&|`$()<>\n")
+
 
 class URLInput(BaseModel):
     """Validated URL input."""
@@ -64,16 +72,11 @@ class DomainInput(BaseModel):
             raise ValueError("Domain cannot be empty")
 
         # Remove protocol if present
-        v = re.sub(r"^https?://", "", v)
+        v = SCHEME_PATTERN.sub("", v)
         v = v.split("/")[0]  # Remove path
 
         # Basic domain validation
-        domain_pattern = re.compile(
-            r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+"
-            r"[a-zA-Z]{2,}$"
-        )
-
-        if not domain_pattern.match(v):
+        if not DOMAIN_PATTERN.match(v):
             raise ValueError(
                 f"Invalid domain format: {v}. "
                 "Domain must be a valid DNS name"
@@ -141,8 +144,7 @@ class CommandArgument(BaseModel):
             return v
 
         # Check for shell metacharacters
-        dangerous_chars = [";", "&", "|", "`", "$", "(", ")", "<", ">", "\n"]
-        if any(char in v for char in dangerous_chars):
+        if not DANGEROUS_CHARS.isdisjoint(v):
             raise ValueError(
                 f"Command argument contains dangerous characters: {v}"
             )
@@ -2,7 +2,7 @@ import os
 
 from fsociety.core.menu import set_readline
 from fsociety.core.repo import GitHubRepo
-from fsociety.core.usernames import add_username, get_usernames
+from fsociety.core.usernames import add_usernames, get_usernames
 
 
 class SherlockRepo(GitHubRepo):
@@ -18,9 +18,12 @@ class SherlockRepo(GitHubRepo):
         usernames = get_usernames()
         set_readline(usernames)
         user_usernames = input("\nEnter one or more usernames: ").strip()
-        for username in user_usernames.split():
-            if username not in usernames:
-                add_username(username)
+        known_usernames = set(usernames)
+        add_usernames(
+            username
+            for username in dict.fromkeys(user_usernames.split())
+            if username not in known_usernames
+        )
         return os.system(f"python3 sherlock {user_usernames}")
 
 
@@ -21,6 +21,7 @@ premade_args = {
     "heartbleed_test": "-sV -p 443 --script=ssl-heartbleed {host}",
     "slowloris": "-max-parallelism 800 -Pn --script http-slowloris --script-args http-slowloris.runforever=true {host}",
 }
+longest_key = max(len(key) for key in premade_args) + 2
 
 
 class NmapRepo(GitHubRepo):
@@ -49,7 +50,6 @@ class NmapRepo(GitHubRepo):
             raise InvalidHost
         if host not in hosts:
             add_host(host)
-        longest_key = max(len(key) for key in premade_args) + 2
         print("\nName".ljust(longest_key) + " | Args")
         for name, args in premade_args.items():
             print(f"{name.ljust(longest_key)}: {args.format(host=host)}")
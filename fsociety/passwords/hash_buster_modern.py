@@ -7,6 +7,7 @@ cracking using hashcat.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 from fsociety.core.executor import execute_python_script
@@ -14,7 +15,6 @@ from fsociety.core.gpu_accelerator import (
     HashcatCracker,
     HashType,
     AttackMode,
-    detect_gpu,
 )
 from fsociety.core.logging_config import get_logger
 from fsociety.core.menu import confirm, set_readline
@@ -23,6 +23,16 @@ from fsociety.core.validation import validate_command_arg
 
 logger = get_logger(__name__)
 
+# Raw hex digest length -> hash type. NTLM digests are also 32 hex
+# characters and cannot be told apart from MD5 by shape alone.
+HASH_TYPES_BY_LENGTH = {
+    32: HashType.MD5,
+    40: HashType.SHA1,
+    64: HashType.SHA256,
+    128: HashType.SHA512,
+}
+HEX_DIGEST = re.compile(r"[0-9a-fA-F]+")
+
 
 class HashBusterRepo(GitHubRepo):
     """Hash cracking tool with GPU acceleration."""
@@ -45,22 +55,13 @@ class HashBusterRepo(GitHubRepo):
         Returns:
             Detected HashType or None
         """
-        hash_len = len(hash_value)
-
-        match hash_len:
-            case 32 if hash_value.isalnum():
-                return HashType.MD5
-            case 40 if hash_value.isalnum():
-                return HashType.SHA1
-            case 64 if hash_value.isalnum():
-                return HashType.SHA256
-            case 128 if hash_value.isalnum():
-                return HashType.SHA512
-            case 32 if ":" not in hash_value:
-                return HashType.NTLM
-            case _:
-                logger.warning(f"Could not detect hash type for: {hash_value}")
-                return None
+        hash_type = HASH_TYPES_BY_LENGTH.get(len(hash_value))
+
+        if hash_type is None or not HEX_DIGEST.fullmatch(hash_value):
+            logger.warning(f"Could not detect hash type for: {hash_value}")
+            return None
+
+        return hash_type
 
     def _run_online_lookup(self, hash_value: str) -> int:
         """Run online hash lookup using Hash-Buster."""
@@ -89,8 +90,8 @@ class HashBusterRepo(GitHubRepo):
         """Run GPU-accelerated cracking with hashcat."""
         logger.info("Starting GPU-accelerated cracking...")
 
-        # Detect GPU capabilities
-        gpu_info = detect_gpu()
+        # Reuse the capabilities probed when the cracker was created
+        gpu_info = self.cracker.gpu_info
 
         if not gpu_info.is_available():
             logger.warning(